@@ -16,16 +16,22 @@ from matio.utils import (
     mat_to_timetable,
 )
 
+
+def wrap_containermap(props, **_kwargs):
+    """Converts containers.Map, keeping the class name alongside the dictionary"""
+    return {
+        "_Class": "containers.Map",
+        "_Props": mat_to_containermap(props),
+    }
+
+
 CLASS_TO_FUNCTION = {
     "datetime": mat_to_datetime,
     "duration": mat_to_duration,
     "string": mat_to_string,
     "table": mat_to_table,
     "timetable": mat_to_timetable,
-    "containers.Map": lambda props, **kwargs: {
-        "_Class": "containers.Map",
-        "_Props": mat_to_containermap(props),
-    },
+    "containers.Map": wrap_containermap,
     "categorical": mat_to_categorical,
     "dictionary": mat_to_dictionary,
     "calendarDuration": mat_to_calendarduration,
@@ -37,20 +43,13 @@ def convert_to_object(
 ):
     """Converts the object to a Python compatible object"""
 
-    if raw_data:
+    func = None if raw_data else CLASS_TO_FUNCTION.get(class_name)
+    if func is None:
         return {
             "_Class": class_name,
             "_Props": props,
         }
 
-    func = CLASS_TO_FUNCTION.get(
-        class_name,
-        lambda props, **kwargs: {
-            "_Class": class_name,
-            "_Props": props,
-        },
-    )
-
     return func(props, byte_order=byte_order, add_table_attrs=add_table_attrs)
 
 
@@ -62,5 +61,8 @@ def mat_to_enum(values, value_names, class_name, shapes):
         {name: val["_Props"].item() for name, val in zip(value_names, values)},
     )
 
-    enum_members = [enum_class(val["_Props"].item()) for val in values]
-    return np.array(enum_members, dtype=object).reshape(shapes, order="F")
+    enum_array = np.empty(shapes, dtype=object, order="F")
+    enum_flat = enum_array.reshape(-1, order="F")  # View into enum_array
+    for i, val in enumerate(values):
+        enum_flat[i] = enum_class(val["_Props"].item())
+    return enum_array
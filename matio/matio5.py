@@ -49,7 +49,8 @@ def find_opaque_dtype(arr, subsystem, path=()):
     This is a hacky solution to find mxOPAQUE_CLASS arrays inside struct arrays or cell arrays.
     """
 
-    if not isinstance(arr, np.ndarray):
+    if not isinstance(arr, np.ndarray) or arr.dtype.kind not in "OV":
+        # Only cell, struct and opaque arrays can contain objects
         return arr
 
     if arr.dtype == OPAQUE_DTYPE:
@@ -59,31 +60,31 @@ def find_opaque_dtype(arr, subsystem, path=()):
 
     if arr.dtype == object:
         # Iterate through cell arrays
-        for idx in np.ndindex(arr.shape):
-            cell_item = arr[idx]
+        for idx, cell_item in enumerate(arr.flat):
             if cell_item.dtype == OPAQUE_DTYPE:
                 type_system = cell_item[0]["_TypeSystem"]
                 metadata = cell_item[0]["_Metadata"]
-                arr[idx] = subsystem.read_mcos_object(metadata, type_system)
+                arr.flat[idx] = subsystem.read_mcos_object(metadata, type_system)
             else:
                 find_opaque_dtype(cell_item, subsystem, path + (idx,))
 
     elif arr.dtype.names:
         # Iterate though struct array
-        for idx in np.ndindex(arr.shape):
-            for name in arr.dtype.names:
-                field_val = arr[idx][name]
+        for name in arr.dtype.names:
+            # Field views write through to the struct array
+            field = arr[name]
+            for idx, field_val in enumerate(field.flat):
                 if field_val.dtype == OPAQUE_DTYPE:
                     type_system = field_val[0]["_TypeSystem"]
                     metadata = field_val[0]["_Metadata"]
-                    arr[idx][name] = subsystem.read_mcos_object(metadata, type_system)
+                    field.flat[idx] = subsystem.read_mcos_object(metadata, type_system)
                 else:
                     find_opaque_dtype(field_val, subsystem, path + (idx, name))
 
     return arr
 
 
-def read_matfile5(
+def read_matfile5(  # pylint: disable=too-many-arguments
     file_path,
     raw_data=False,
     add_table_attrs=False,
@@ -93,6 +94,11 @@ def read_matfile5(
     chars_as_strings=True,
     verify_compressed_data_integrity=True,
     variable_names=None,
+    *,
+    use_mmap=False,  # pylint: disable=unused-argument
+    rdcc_nbytes=None,  # pylint: disable=unused-argument
+    rdcc_nslots=None,  # pylint: disable=unused-argument
+    rdcc_w0=None,  # pylint: disable=unused-argument
 ):
     """Loads variables from MAT-file < v7.3
     Calls scipy.io.loadmat to read the MAT-file and then processes the
@@ -106,6 +112,8 @@ def read_matfile5(
         6. chars_as_strings (bool): Whether to load character arrays as strings
         8. verify_compressed_data_integrity (bool): Whether to verify compressed data integrity
         9. variable_names (list): List of variable names to load
+        10. use_mmap (bool): Only used for v7.3 MAT-files
+        11. rdcc_nbytes, rdcc_nslots, rdcc_w0: Only used for v7.3 MAT-files
     Returns:
         1. matfile_dict (dict): Dictionary of loaded variables
     """
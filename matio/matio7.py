@@ -1,5 +1,6 @@
 """MATLAB MAT-file version 7.3 (HDF5) reader."""
 
+import os
 import warnings
 
 import h5py
@@ -12,6 +13,11 @@ from scipy.sparse import coo_matrix, csc_array, issparse
 
 from matio.subsystem import SubsystemReader
 
+H5_CHUNK_CACHE_SIZE = 64 * 1024 * 1024
+H5_CHUNK_CACHE_SLOTS = 100003  # Prime, well above the number of cached chunks
+H5_CHUNK_CACHE_W0 = 0.75
+H5_CORE_DRIVER_MAX_SIZE = 512 * 1024 * 1024
+
 
 class MatRead7:
     """Reads MAT-file version 7.3 (HDF5) files."""
@@ -31,6 +37,21 @@ class MatRead7:
         self.add_table_attrs = add_table_attrs
         self.chars_as_strings = chars_as_strings
 
+        # Readers for MATLAB classes with a fixed storage layout
+        # All are called as reader(obj, is_empty, attrs)
+        self.class_readers = {
+            b"char": self.read_char,
+            b"logical": self.read_logical,
+            b"struct": self.read_struct,
+            b"cell": self.read_cell,
+        }
+        for int_class in (
+            b"int8", b"uint8", b"int16", b"uint16",
+            b"int32", b"uint32", b"int64", b"uint64",
+            b"single", b"double"
+        ):
+            self.class_readers[int_class] = self.read_int
+
     def initialize_v73_subsystem(self, byte_order, raw_data, add_table_attrs):
         """Initializes the subsystem for v7.3 MAT-files."""
 
@@ -39,20 +60,21 @@ class MatRead7:
         subsystem.init_fields_v73(subsystem_arr)
         return subsystem
 
-    def read_int(self, obj, is_empty=0):
+    def read_int(self, obj, is_empty=0, attrs=None):
         """Reads MATLAB integer arrays from the v7.3 MAT-file."""
 
-        int_decode = obj.attrs.get("MATLAB_int_decode", None)
+        attrs = obj.attrs if attrs is None else attrs
+        int_decode = attrs.get("MATLAB_int_decode", None)
         if int_decode is not None:
             warnings.warn(
                 f"MATLAB_int_decode {int_decode} is not supported. "
                 "This may lead to unexpected behaviour.", UserWarning
             )
 
+        arr = obj[()]
         if is_empty:
-            return np.empty(shape=obj[()], dtype=obj[()].dtype)
+            return np.empty(shape=arr, dtype=arr.dtype)
 
-        arr = obj[()]
         if arr.dtype.names:
             # complex number
             real = arr["real"]
@@ -61,12 +83,28 @@ class MatRead7:
             arr.real = real
             arr.imag = imag
 
+        # HDF5 stores MATLAB arrays transposed, the transposed view is
+        # already Fortran-contiguous so no copy is made here
         return arr.T
 
-    def read_char(self, obj, is_empty=0):
+    def read_logical(self, obj, is_empty=0, attrs=None): # pylint: disable=unused-argument
+        """Reads MATLAB logical arrays from the v7.3 MAT-file."""
+
+        arr = obj[()]
+        if is_empty:
+            return np.empty(shape=arr, dtype=np.bool_)
+
+        # Logicals are stored as 0/1 uint8, reinterpret instead of copying
+        arr = arr.T
+        if arr.dtype.itemsize == 1:
+            return arr.view(np.bool_)
+        return arr.astype(np.bool_)
+
+    def read_char(self, obj, is_empty=0, attrs=None):
         """Decodes MATLAB char arrays from the v7.3 MAT-file."""
 
-        decode_type = obj.attrs.get("MATLAB_int_decode", None)
+        attrs = obj.attrs if attrs is None else attrs
+        decode_type = attrs.get("MATLAB_int_decode", None)
         raw = obj[()].T
 
         if is_empty:
@@ -82,7 +120,16 @@ class MatRead7:
             )
             codec = "utf-8"
 
-        decoded_arr = np.array(list(raw.tobytes().decode(codec))).reshape(raw.shape)
+        if codec == "utf-16" and raw.dtype == np.uint16 and not np.any(
+            (raw >= 0xD800) & (raw <= 0xDFFF)
+        ):
+            # Without surrogate pairs UTF-16 code units are the code points
+            # Widening to UCS-4 gives the char array without decoding
+            decoded_arr = raw.astype(np.uint32, order="C").view("U1")
+        else:
+            # Decode in one pass and view the UCS-4 buffer as individual chars
+            decoded = raw.tobytes().decode(codec)
+            decoded_arr = np.array([decoded]).view("U1").reshape(raw.shape)
         if self.chars_as_strings:
             return chars_to_strings(decoded_arr)
         return decoded_arr
@@ -104,14 +151,15 @@ class MatRead7:
 
         return True
 
-    def read_struct(self, obj, is_empty=0):
+    def read_struct(self, obj, is_empty=0, attrs=None):
         """Reads MATLAB struct arrays from the v7.3 MAT-file."""
 
         if is_empty:
             return np.empty(shape=obj[()], dtype=object)
 
         fields = list(obj.keys())
-        field_order = obj.attrs.get("MATLAB_fields", None)
+        attrs = obj.attrs if attrs is None else attrs
+        field_order = attrs.get("MATLAB_fields", None)
         if field_order is not None:
             # For maximum compatibility with scipy.io
             fields = [''.join(x.astype(str)) for x in field_order]
@@ -126,26 +174,30 @@ class MatRead7:
         dt = [(name, object) for name in fields]
         arr = np.empty(shape=shape, dtype=dt)
 
+        h5stream, read_h5_data = self.h5stream, self.read_h5_data
         for field in obj:
             obj_field = obj[field]
-            for idx in np.ndindex(arr.shape):
-                if is_scalar:
-                    arr[idx][field] = self.read_h5_data(obj_field)
-                else:
-                    arr[idx][field] = self.read_h5_data(self.h5stream[obj_field[idx]])
+            if is_scalar:
+                arr[0, 0][field] = read_h5_data(obj_field)
+                continue
+
+            field_vals = arr[field].reshape(-1)
+            for i, ref in enumerate(obj_field[()].ravel()):
+                field_vals[i] = read_h5_data(h5stream[ref])
         return arr.T
 
-    def read_cell(self, obj, is_empty=0):
+    def read_cell(self, obj, is_empty=0, attrs=None): # pylint: disable=unused-argument
         """Reads MATLAB cell arrays from the v7.3 MAT-file."""
 
         if is_empty:
             return np.empty(shape=obj[()], dtype=object)
 
-        arr = np.empty(shape=obj.shape, dtype=object)
-        for idx in np.ndindex(obj.shape):
-            ref_data = self.h5stream[obj[idx]]
-            arr[idx] = self.read_h5_data(ref_data)
-        return arr.T
+        refs = obj[()]
+        arr = np.empty(shape=refs.size, dtype=object)
+        h5stream, read_h5_data = self.h5stream, self.read_h5_data
+        for i, ref in enumerate(refs.ravel()):
+            arr[i] = read_h5_data(h5stream[ref])
+        return arr.reshape(refs.shape).T
 
     def read_sparse(self, obj, nrows):
         """Reads MATLAB sparse arrays from the v7.3 MAT-file."""
@@ -175,11 +227,11 @@ class MatRead7:
             f"Function handle object_decode {object_decode} not supported. Only 1 is supported."
         )
 
-    def read_object(self, obj, class_name):
+    def read_object(self, obj, class_name, attrs=None):
         """Reads mxOBJECT_CLASS variables from the v7.3 MAT-file."""
 
         class_name = class_name.decode("utf-8")
-        fields = self.read_struct(obj)
+        fields = self.read_struct(obj, attrs=attrs)
 
         return MatlabObject(fields, class_name)
 
@@ -198,10 +250,11 @@ class MatRead7:
 
         return type_system
 
-    def read_opaque(self, obj, object_decode, is_empty=0):
+    def read_opaque(self, obj, object_decode, is_empty=0, attrs=None):
         """Reads MATLAB opaque objects from the v7.3 MAT-file."""
 
-        class_name = obj.attrs.get("MATLAB_class", None)
+        attrs = obj.attrs if attrs is None else attrs
+        class_name = attrs.get("MATLAB_class", None)
         if class_name == b"FileWrapper__":
             return self.read_cell(obj)
 
@@ -210,7 +263,7 @@ class MatRead7:
             # Object Decode = 1 -> Function Handle (possibly)
             # Object Decode = 2 -> mxOBJECT_CLASS
             # Object Decode = 3 -> mxOPAQUE_CLASS
-            return self.read_object(obj, class_name)
+            return self.read_object(obj, class_name, attrs)
 
         if is_empty:
             return np.empty(shape=obj[()], dtype=object)
@@ -221,12 +274,12 @@ class MatRead7:
         type_system = self.get_type_system(class_name)
 
         # Check Enumeration Instances
-        fields = obj.attrs.get("MATLAB_fields", None)
+        fields = attrs.get("MATLAB_fields", None)
         if fields is not None:
             fields = [''.join(x.astype(str)) for x in fields]
 
             if "EnumerationInstanceTag" in fields:
-                metadata = self.read_struct(obj)
+                metadata = self.read_struct(obj, attrs=attrs)
                 if metadata[0, 0]["EnumerationInstanceTag"] != 0xDD000000:
                     return metadata
             else:
@@ -238,33 +291,26 @@ class MatRead7:
     def read_h5_data(self, obj):
         """Reads data from the HDF5 object."""
 
-        matlab_class = obj.attrs.get("MATLAB_class", None)
-        is_empty = obj.attrs.get("MATLAB_empty", 0)
-        object_decode = obj.attrs.get("MATLAB_object_decode", -1)
-        matlab_sparse = obj.attrs.get("MATLAB_sparse", -1)
+        # Fetch all attributes at once instead of one HDF5 lookup per key
+        attrs = dict(obj.attrs)
+        matlab_class = attrs.get("MATLAB_class", None)
+        is_empty = attrs.get("MATLAB_empty", 0)
+        object_decode = attrs.get("MATLAB_object_decode", -1)
+        matlab_sparse = attrs.get("MATLAB_sparse", -1)
 
         if matlab_sparse >= 0:
-            arr = self.read_sparse(obj, matlab_sparse)
-        elif matlab_class == b"char":
-            arr = self.read_char(obj, is_empty)
-        elif matlab_class == b"logical":
-            arr = obj[()].T.astype(np.bool_)
-        elif matlab_class in (
-            b"int8", b"uint8", b"int16", b"uint16",
-            b"int32", b"uint32", b"int64", b"uint64",
-            b"single", b"double"
-        ):
-            arr = self.read_int(obj, is_empty)
-        elif matlab_class == b"struct":
-            arr = self.read_struct(obj, is_empty)
-        elif matlab_class == b"cell":
-            arr = self.read_cell(obj, is_empty)
-        elif matlab_class == b"function_handle":
+            return self.read_sparse(obj, matlab_sparse)
+
+        reader = self.class_readers.get(matlab_class)
+        if reader is not None:
+            return reader(obj, is_empty, attrs)
+
+        if matlab_class == b"function_handle":
             arr = self.read_function_handle(obj, object_decode)
         elif matlab_class == b"canonical empty" and is_empty:
             arr = np.empty(shape=(0, 0), dtype=object)
         elif object_decode >= 0:
-            arr = self.read_opaque(obj, object_decode, is_empty)
+            arr = self.read_opaque(obj, object_decode, is_empty, attrs)
         else:
             raise NotImplementedError(
                 f"MATLAB class {matlab_class} not supported", UserWarning)
@@ -274,9 +320,9 @@ class MatRead7:
     def get_variables(self, variable_names, byte_order, raw_data, add_table_attrs):
         """Reads variables from the HDF5 file."""
         if isinstance(variable_names, str):
-            variable_names = [variable_names]
+            variable_names = {variable_names}
         elif variable_names is not None:
-            variable_names = list(variable_names)
+            variable_names = set(variable_names)
 
         mdict = {}
         mdict['__globals__'] = []
@@ -285,11 +331,12 @@ class MatRead7:
             self.subsystem = self.initialize_v73_subsystem(byte_order, raw_data, add_table_attrs)
 
         for var in self.h5stream:
-            obj = self.h5stream[var]
+            # Filter by name before looking up the HDF5 object
             if var in ('#refs#', '#subsystem#'):
                 continue
             if variable_names is not None and var not in variable_names:
                 continue
+            obj = self.h5stream[var]
             try:
                 data = self.read_h5_data(obj)
             except Exception as err:
@@ -306,19 +353,24 @@ class MatRead7:
 
 def read_file_header(file_path):
     """Reads the file header of the MAT-file."""
-    with open(file_path, "rb") as f:
-        f.seek(0)
-        hdr = f.read(128)
-        v_major = hdr[125] if hdr[126] == b'I'[0] else hdr[124]
-        v_minor = hdr[124] if hdr[126] == b'I'[0] else hdr[125]
-        byte_order = "<" if hdr[126] == b'I'[0] else ">"
-
-        hdict = {}
-        hdict['__header__'] = hdr[0:116].decode('utf-8').strip(' \t\n\000')
-        hdict['__version__'] = f"{v_major}.{v_minor}"
+    if hasattr(file_path, "read"):
+        file_path.seek(0)
+        hdr = file_path.read(128)
+        file_path.seek(0)
+    else:
+        with open(file_path, "rb") as f:
+            hdr = f.read(128)
+
+    v_major = hdr[125] if hdr[126] == b'I'[0] else hdr[124]
+    v_minor = hdr[124] if hdr[126] == b'I'[0] else hdr[125]
+    byte_order = "<" if hdr[126] == b'I'[0] else ">"
+
+    hdict = {}
+    hdict['__header__'] = hdr[0:116].decode('utf-8').strip(' \t\n\000')
+    hdict['__version__'] = f"{v_major}.{v_minor}"
     return hdict, byte_order
 
-def read_matfile7(file_path,
+def read_matfile7(file_path, # pylint: disable=too-many-arguments
                   raw_data=False,
                   add_table_attrs=False,
                   spmatrix=True,
@@ -326,12 +378,18 @@ def read_matfile7(file_path,
                   mat_dtype=False, # pylint: disable=unused-argument
                   chars_as_strings=True,
                   verify_compressed_data_integrity=True, # pylint: disable=unused-argument
-                  variable_names=None):
+                  variable_names=None,
+                  *,
+                  use_mmap=False,
+                  rdcc_nbytes=H5_CHUNK_CACHE_SIZE,
+                  rdcc_nslots=H5_CHUNK_CACHE_SLOTS,
+                  rdcc_w0=H5_CHUNK_CACHE_W0):
     """Reads MAT-file version 7.3 (HDF5) files.
     Parameters
     ----------
-        file_path : str
-            Path to the MAT-file.
+        file_path : str or file-like
+            Path to the MAT-file, or a seekable binary file object. Remote files can be
+            passed as a buffered file object (e.g. from fsspec) to avoid many small reads.
         raw_data : bool, optional
             If True, returns raw data for MATLAB object instances. Default is False.
         add_table_attrs : bool, optional
@@ -341,10 +399,31 @@ def read_matfile7(file_path,
         chars_as_strings : bool, optional
             If True, converts character arrays to strings. Default is True.
         variable_names : list of str or str, optional
-            Names of variables to read from the MAT-file. Default is None (reads all variables)."""
+            Names of variables to read from the MAT-file. Default is None (reads all variables).
+        use_mmap : bool, optional
+            If True, files smaller than H5_CORE_DRIVER_MAX_SIZE are read into memory once
+            using the HDF5 core driver instead of issuing a read per dataset. Faster for files
+            with many small cells or structs, at the cost of holding the file in memory.
+            Default is False.
+        rdcc_nbytes, rdcc_nslots, rdcc_w0 : optional
+            HDF5 raw data chunk cache size in bytes, number of hash slots and
+            preemption policy, passed to h5py.File.
+            Unused when the file is loaded into memory with use_mmap."""
 
     matfile_dict, byte_order = read_file_header(file_path)
-    f = h5py.File(file_path, "r")
+    # Cells and struct arrays are stored as many small datasets under #refs#
+    # A larger chunk cache avoids re-reading chunks while dereferencing them
+    is_path = not hasattr(file_path, "read")
+    if use_mmap and is_path and os.path.getsize(file_path) < H5_CORE_DRIVER_MAX_SIZE:
+        f = h5py.File(file_path, "r", driver="core", backing_store=False)
+    else:
+        f = h5py.File(
+            file_path,
+            "r",
+            rdcc_nbytes=rdcc_nbytes,
+            rdcc_nslots=rdcc_nslots,
+            rdcc_w0=rdcc_w0,
+        )
     mat_reader = MatRead7(f, raw_data, add_table_attrs, chars_as_strings)
     try:
         mdict = mat_reader.get_variables(variable_names, byte_order, raw_data, add_table_attrs)
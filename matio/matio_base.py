@@ -36,7 +36,7 @@ def load_from_mat(
     Calls scipy.io.loadmat to read the MAT-file and then processes the
     "__function_workspace__" variable to extract subsystem data.
     Inputs
-        1. file_path (str): Path to MAT-file
+        1. file_path (str or file-like): Path to MAT-file or a seekable binary file object
         2. mdict (dict): Dictionary to store loaded variables
         3. raw_data (bool): Whether to return raw data for objects
         4. add_table_attrs (bool): Add attributes to pandas DataFrame for MATLAB tables/timetables
@@ -46,10 +46,15 @@ def load_from_mat(
         1. mdict (dict): Dictionary of loaded variables
     """
 
-    with open(file_path, "rb") as f:
-        f.seek(124)
-        version_bytes = f.read(4)
-        v_major, v_minor = get_matfile_version(version_bytes)
+    if hasattr(file_path, "read"):
+        file_path.seek(124)
+        version_bytes = file_path.read(4)
+        file_path.seek(0)
+    else:
+        with open(file_path, "rb") as f:
+            f.seek(124)
+            version_bytes = f.read(4)
+    v_major, v_minor = get_matfile_version(version_bytes)
 
     if v_major == 1:
         matfile_dict = read_matfile5(
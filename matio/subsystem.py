@@ -1,11 +1,15 @@
 """Reads MCOS subsystem data from MAT files"""
 
+import math
 import warnings
 
 import numpy as np
 
 from matio.convert import convert_to_object, mat_to_enum
 
+# Compared against on every reference check, built once instead of per call
+UINT32_DTYPE = np.dtype(np.uint32)
+
 
 class SubsystemReader:
     """Extracts object properties from the subsystem data
@@ -22,6 +26,11 @@ class SubsystemReader:
         self.fwrap_vals = None
         self.fwrap_defaults = None
         self.mcos_names = None
+        self.metadata_words = None
+        self.region_offsets = None
+        self.block_offsets = {}
+        self.object_table = None
+        self.type2_objects = None
 
     def init_fields_v7(self, ssdata):
         """Fetches metadata and field contents from the subsystem data
@@ -35,9 +44,8 @@ class SubsystemReader:
         if "MCOS" in ssdata.dtype.names:
             fwrap_data = ssdata[0, 0]["MCOS"][0]["_Metadata"]
             self.fwrap_metadata = fwrap_data[0, 0][:, 0]
-            toc_flag = np.frombuffer(
-                self.fwrap_metadata, dtype=self.byte_order, count=1, offset=0
-            )[0]
+            self.metadata_words = self.get_metadata_words()
+            toc_flag = self.metadata_words[0]
 
             if toc_flag != 4:
                 warnings.warn(
@@ -47,6 +55,8 @@ class SubsystemReader:
 
             self.fwrap_vals = fwrap_data[2:-3, 0]
             self.fwrap_defaults = fwrap_data[-3:, 0]
+            self.region_offsets = self.get_region_offsets()
+            self.object_table = self.get_object_table()
             self.mcos_names = self.get_field_names()
 
     def init_fields_v73(self, ssdata):
@@ -56,9 +66,8 @@ class SubsystemReader:
 
         if "MCOS" in ssdata.dtype.names:
             self.fwrap_metadata = ssdata[0, 0]["MCOS"][0,0]
-            toc_flag = np.frombuffer(
-                self.fwrap_metadata, dtype=self.byte_order, count=1, offset=0
-            )[0]
+            self.metadata_words = self.get_metadata_words()
+            toc_flag = self.metadata_words[0]
 
             if toc_flag != 4:
                 warnings.warn(
@@ -68,8 +77,40 @@ class SubsystemReader:
 
             self.fwrap_vals = ssdata[0, 0]["MCOS"][2:-3,0]
             self.fwrap_defaults = ssdata[0, 0]["MCOS"][-3:,0]
+            self.region_offsets = self.get_region_offsets()
+            self.object_table = self.get_object_table()
             self.mcos_names = self.get_field_names()
 
+    def get_metadata_words(self):
+        """Views the metadata as uint32 words
+        All metadata regions are 8-byte aligned, so lookups slice this view
+        by word index instead of creating a new buffer view per read
+        Returns:
+            1. metadata_words: Numpy array view of the metadata
+        """
+        return np.frombuffer(
+            self.fwrap_metadata,
+            dtype=self.byte_order,
+            count=self.fwrap_metadata.size // 4,
+        )
+
+    def get_region_offsets(self):
+        """Reads the byte offsets of each metadata region
+        Offsets are stored as 8 uint32 values after the version and name count
+        Returns:
+            1. region_offsets: List of region start offsets as Python ints
+        """
+        return self.metadata_words[2:10].tolist()
+
+    def get_object_table(self):
+        """Views the object dependency region as an N x 6 table
+        Row i holds the 6 uint32 values of the block for object ID i
+        Returns:
+            1. object_table: Numpy array view of the object dependency blocks
+        """
+        start, end = self.region_offsets[2:4]
+        return self.metadata_words[start // 4 : end // 4].reshape(-1, 6)
+
     def get_field_names(self):
         """Extracts field and class names from the subsystem data
         Names are stored as a list of null-terminated strings
@@ -79,13 +120,11 @@ class SubsystemReader:
         Returns:
             1. all_names: List of field and class names
         """
-        byte_end = np.frombuffer(
-            self.fwrap_metadata, dtype=self.byte_order, count=1, offset=8
-        )[0]
+        byte_end = self.region_offsets[0]
         byte_start = 8 + 8 * 4
-        data = self.fwrap_metadata[byte_start:byte_end].tobytes()
-        raw_strings = data.split(b"\x00")
-        all_names = [s.decode("ascii") for s in raw_strings if s]
+        # Decode the whole block once, then split into names
+        data = self.fwrap_metadata[byte_start:byte_end].tobytes().decode("ascii")
+        all_names = [s for s in data.split("\x00") if s]
         return all_names
 
     def get_object_dependencies(self, object_id):
@@ -105,13 +144,7 @@ class SubsystemReader:
             (class_id, type1_id, type2_id, dep_id)
         """
 
-        byte_offset = np.frombuffer(
-            self.fwrap_metadata, dtype=self.byte_order, count=1, offset=16
-        )[0]
-        byte_offset = byte_offset + object_id * 24
-        class_id, _, _, type1_id, type2_id, dep_id = np.frombuffer(
-            self.fwrap_metadata, dtype=self.byte_order, count=6, offset=byte_offset
-        )
+        class_id, _, _, type1_id, type2_id, dep_id = self.object_table[object_id]
 
         return class_id, type1_id, type2_id, dep_id
 
@@ -129,17 +162,10 @@ class SubsystemReader:
             (namespace, class_name)
         """
 
-        byte_offset = np.frombuffer(
-            self.fwrap_metadata, dtype=self.byte_order, count=1, offset=8
-        )[0]
-        byte_offset = byte_offset + class_id * 16
-
-        namespace_idx, class_idx, _, _ = np.frombuffer(
-            self.fwrap_metadata,
-            dtype=self.byte_order,
-            count=4,
-            offset=byte_offset,
-        )
+        word_offset = (self.region_offsets[0] + class_id * 16) // 4
+        namespace_idx, class_idx, _, _ = self.metadata_words[
+            word_offset : word_offset + 4
+        ]
 
         class_name = self.mcos_names[class_idx - 1]
         namespace = self.mcos_names[namespace_idx - 1] if namespace_idx > 0 else None
@@ -159,30 +185,23 @@ class SubsystemReader:
             1. ids: Numpy array of all subblock contents
         """
 
-        # Get block corresponding to type ID
-        while m_id > 0:
-            nblocks = np.frombuffer(
-                self.fwrap_metadata, dtype=self.byte_order, count=1, offset=byte_offset
-            )[0]
-            byte_offset = byte_offset + 4 + nblocks * nbytes
-            if ((nblocks * nbytes) + 4) % 8 != 0:
-                byte_offset += 4
-            m_id -= 1
+        nwords = nbytes // 4
 
-        # Get the number of blocks
-        nblocks = np.frombuffer(
-            self.fwrap_metadata, dtype=self.byte_order, count=1, offset=byte_offset
-        )[0]
+        # Block start offsets are cached per region and extended as needed
+        # so each block is only skipped over once per file
+        offsets = self.block_offsets.setdefault(byte_offset, [byte_offset // 4])
+        while len(offsets) <= m_id:
+            block_words = 1 + int(self.metadata_words[offsets[-1]]) * nwords
+            # Blocks are padded to 8 bytes
+            offsets.append(offsets[-1] + block_words + block_words % 2)
+        word_offset = offsets[m_id]
 
-        byte_offset += 4
-        ids = np.frombuffer(
-            self.fwrap_metadata,
-            dtype=self.byte_order,
-            count=nblocks * nbytes // 4,
-            offset=byte_offset,
-        )
+        # Get the number of blocks
+        nblocks = int(self.metadata_words[word_offset])
+        word_offset += 1
+        ids = self.metadata_words[word_offset : word_offset + nblocks * nwords]
 
-        return ids.reshape((nblocks, nbytes // 4))
+        return ids.reshape((nblocks, nwords))
 
     def get_dynamic_prop_instance(self, type2_id):
         """Reads dynamic property instance ID for a given object
@@ -194,18 +213,16 @@ class SubsystemReader:
             2. object_id of the dynamic property
         """
 
-        start, end = np.frombuffer(
-            self.fwrap_metadata, dtype=self.byte_order, count=2, offset=16
-        )
-        blocks = np.frombuffer(
-            self.fwrap_metadata[start:end], dtype=self.byte_order
-        ).reshape(-1, 6)
+        if self.type2_objects is None:
+            # Map each type 2 ID to its first object once, instead of scanning per lookup
+            self.type2_objects = {}
+            rows = self.object_table[:, [0, 4]].tolist()
+            for idx, (class_id, obj_type2_id) in enumerate(rows):
+                self.type2_objects.setdefault(obj_type2_id, (class_id, idx))
 
-        for idx, block in enumerate(blocks):
-            if block[4] == type2_id:
-                class_id = block[0]
-                object_id = idx
-                return class_id, np.array([object_id])
+        if type2_id in self.type2_objects:
+            class_id, object_id = self.type2_objects[type2_id]
+            return class_id, np.array([object_id])
 
         raise ValueError(f"Dynamic property instance not found for object ID (Type 2): {type2_id}")
 
@@ -216,15 +233,13 @@ class SubsystemReader:
         """
 
         # Get block corresponding to dep_id
-        byte_offset = np.frombuffer(
-            self.fwrap_metadata, dtype=self.byte_order, count=1, offset=24
-        )[0]
+        byte_offset = self.region_offsets[4]
         dyn_prop_type2_ids = self.get_ids(dep_id, byte_offset, nbytes=4)[:, 0]
         if dyn_prop_type2_ids.size == 0:
             return None
 
         dyn_props = {}
-        for i, dyn_prop_id in enumerate(dyn_prop_type2_ids):
+        for i, dyn_prop_id in enumerate(dyn_prop_type2_ids.tolist()):
             class_id, object_id = self.get_dynamic_prop_instance(dyn_prop_id)
             dyn_props[f"__dynamic_property__{i + 1}"] = self.read_object_arrays(
                 object_id, class_id, dims=[1, 1]
@@ -245,11 +260,10 @@ class SubsystemReader:
             return self.read_mcos_object(arr)
 
         if arr.dtype == object:
-            # Iterate through cell arrays
-            for idx in np.ndindex(arr.shape):
-                cell_item = arr[idx]
+            # Iterate through cell arrays by flat index
+            for idx, cell_item in enumerate(arr.flat):
                 if check_object_reference(cell_item):
-                    arr[idx] = self.read_mcos_object(cell_item)
+                    arr.flat[idx] = self.read_mcos_object(cell_item)
                 else:
                     self.find_object_reference(cell_item, path + (idx,))
                 # Path to keep track of the current index
@@ -257,11 +271,12 @@ class SubsystemReader:
             # Iterate through struct array
             if check_object_reference(arr):
                 return self.read_mcos_object(arr)
-            for idx in np.ndindex(arr.shape):
-                for name in arr.dtype.names:
-                    field_val = arr[idx][name]
+            for name in arr.dtype.names:
+                # Field views write through to the struct array
+                field = arr[name]
+                for idx, field_val in enumerate(field.flat):
                     if check_object_reference(field_val):
-                        arr[idx][name] = self.read_mcos_object(field_val)
+                        field.flat[idx] = self.read_mcos_object(field_val)
                     else:
                         self.find_object_reference(field_val, path + (idx, name))
 
@@ -297,14 +312,10 @@ class SubsystemReader:
 
         if type1_id == 0 and type2_id != 0:
             obj_type_id = type2_id
-            byte_offset = np.frombuffer(
-                self.fwrap_metadata, dtype=self.byte_order, count=1, offset=20
-            )[0]
+            byte_offset = self.region_offsets[3]
         elif type1_id != 0 and type2_id == 0:
             obj_type_id = type1_id
-            byte_offset = np.frombuffer(
-                self.fwrap_metadata, dtype=self.byte_order, count=1, offset=12
-            )[0]
+            byte_offset = self.region_offsets[1]
         else:
             raise ValueError("Could not determine object type")
 
@@ -404,17 +415,17 @@ class SubsystemReader:
             builtin_class_name = None
 
         value_names = [
-            self.mcos_names[val - 1] for val in metadata[0, 0]["ValueNames"].ravel()
+            self.mcos_names[val - 1]
+            for val in metadata[0, 0]["ValueNames"].ravel().tolist()
         ]  # Array is N x 1 shape
 
         enum_vals = []
         value_idx = metadata[0, 0]["ValueIndices"]
         mmdata = metadata[0, 0]["Values"]  # Array is N x 1 shape
         if mmdata.size != 0:
-            mmdata_map = mmdata[value_idx]
-            for val in np.nditer(mmdata_map, flags=["refs_ok"], op_flags=["readonly"]):
-                obj_array = self.read_normal_mcos(val.item())
-                enum_vals.append(obj_array)
+            # Same memory order as nditer, without a 0-d array per element
+            mmdata_map = mmdata[value_idx].ravel(order="K")
+            enum_vals = [self.read_normal_mcos(val) for val in mmdata_map]
 
         if not self.raw_data:
             enum_array = mat_to_enum(
@@ -440,12 +451,12 @@ class SubsystemReader:
     def read_normal_mcos(self, metadata):
         """Reads normal MCOS object from the metadata"""
 
-        ndims = metadata[1, 0]
+        ndims = int(metadata[1, 0])
         dims = metadata[2 : 2 + ndims, 0]
         if dims.size == 0:
-            total_objs = np.uint64(0)
+            total_objs = 0
         else:
-            total_objs = np.prod(dims)
+            total_objs = math.prod(dims.tolist())
 
         object_ids = metadata[2 + ndims : 2 + ndims + total_objs, 0]
         class_id = metadata[-1, 0]
@@ -470,7 +481,7 @@ class SubsystemReader:
             )
             return metadata
 
-        if metadata.dtype == np.uint32:
+        if metadata.dtype == UINT32_DTYPE:
             return self.read_normal_mcos(metadata)
 
         return metadata
@@ -483,19 +494,16 @@ def check_object_reference(metadata):
 
     if metadata.dtype.names:
         if "EnumerationInstanceTag" in metadata.dtype.names:
-            if (
-                metadata[0, 0]["EnumerationInstanceTag"].dtype == np.uint32
-                and metadata[0, 0]["EnumerationInstanceTag"].size == 1
-                and metadata[0, 0]["EnumerationInstanceTag"] == 0xDD000000
-            ):
+            tag = metadata[0, 0]["EnumerationInstanceTag"]
+            if tag.dtype == UINT32_DTYPE and tag.size == 1 and tag == 0xDD000000:
                 return True
         return False
 
     if not (
-        metadata.dtype == np.uint32
+        metadata.dtype == UINT32_DTYPE
         and metadata.ndim == 2
-        and metadata.shape == (metadata.shape[0], 1)
-        and metadata.size >= 3
+        and metadata.shape[1] == 1
+        and metadata.shape[0] >= 3
     ):
         return False
 
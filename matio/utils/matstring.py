@@ -1,9 +1,13 @@
 """Utility functions for convertin MATLAB strings"""
 
+import math
 import warnings
 
 import numpy as np
 
+# UTF-16 codec for each byte order marker
+UTF16_BY_ORDER = {"<": "utf-16-le", ">": "utf-16-be"}
+
 
 def mat_to_string(props, byte_order, **_kwargs):
     """Parse string data from MATLAB file
@@ -27,19 +31,39 @@ def mat_to_string(props, byte_order, **_kwargs):
             UserWarning,
         )
 
-    ndims = data[0, 1]
-    shape = data[0, 2 : 2 + ndims]
-    num_strings = np.prod(shape)
+    ndims = int(data[0, 1])
+    shape = data[0, 2 : 2 + ndims].tolist()
+    num_strings = math.prod(shape)
     char_counts = data[0, 2 + ndims : 2 + ndims + num_strings]
-    byte_data = data[0, 2 + ndims + num_strings :].tobytes()
-
-    strings = []
-    pos = 0
-    encoding = "utf-16-le" if byte_order[0] == "<" else "utf-16-be"
-    for char_count in char_counts:
-        byte_length = char_count * 2  # UTF-16 encoding
-        extracted_string = byte_data[pos : pos + byte_length].decode(encoding)
-        strings.append(np.str_(extracted_string))
-        pos += byte_length
+    # View the payload as bytes instead of copying it out with tobytes()
+    payload = np.ascontiguousarray(data[0, 2 + ndims + num_strings :])
+    byte_data = memoryview(payload.view(np.uint8))
+
+    encoding = UTF16_BY_ORDER[byte_order[0]]
+
+    if num_strings == 1:
+        # Single string, no offsets needed
+        decoded = str(byte_data[: 2 * int(char_counts[0])], encoding)
+        return np.reshape([decoded], shape)
+
+    # char_counts are in UTF-16 code units, decode all strings in one pass
+    offsets = np.zeros(char_counts.size + 1, dtype=np.int64)
+    np.cumsum(char_counts, out=offsets[1:])
+    num_chars = int(offsets[-1])
+    decoded = str(byte_data[: 2 * num_chars], encoding)
+
+    if len(decoded) != num_chars:
+        # Surrogate pairs are two code units but decode to a single character
+        # Shift each offset back by the number of pairs preceding it
+        code_units = np.frombuffer(
+            byte_data, dtype=byte_order[0] + "u2", count=num_chars
+        )
+        is_high = (code_units >= 0xD800) & (code_units <= 0xDBFF)
+        pairs_before = np.zeros(num_chars + 1, dtype=np.int64)
+        np.cumsum(is_high, out=pairs_before[1:])
+        offsets -= pairs_before[offsets]
+
+    offsets = offsets.tolist()
+    strings = [decoded[i:j] for i, j in zip(offsets[:-1], offsets[1:])]
 
     return np.reshape(strings, shape, order="F")
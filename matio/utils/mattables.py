@@ -11,6 +11,13 @@ MAX_TIMETABLE_VERSION = 6
 MIN_TIMETABLE_VERSION = 2
 
 
+def cellstr_to_list(cells):
+    """Converts a cell array of character vectors to a list of strings
+    Empty character vectors are returned as empty strings
+    """
+    return [s.item() if s.size > 0 else "" for s in cells.ravel()]
+
+
 def add_table_props(df, tab_props):
     """Add MATLAB table properties to pandas DataFrame
     These properties are mostly cell arrays of character vectors
@@ -19,19 +26,12 @@ def add_table_props(df, tab_props):
     df.attrs["Description"] = (
         tab_props["Description"].item() if tab_props["Description"].size > 0 else ""
     )
-    df.attrs["VariableDescriptions"] = [
-        s.item() if s.size > 0 else ""
-        for s in tab_props["VariableDescriptions"].ravel()
-    ]
-    df.attrs["VariableUnits"] = [
-        s.item() if s.size > 0 else "" for s in tab_props["VariableUnits"].ravel()
-    ]
-    df.attrs["VariableContinuity"] = [
-        s.item() if s.size > 0 else "" for s in tab_props["VariableContinuity"].ravel()
-    ]
-    df.attrs["DimensionNames"] = [
-        s.item() if s.size > 0 else "" for s in tab_props["DimensionNames"].ravel()
-    ]
+    df.attrs["VariableDescriptions"] = cellstr_to_list(
+        tab_props["VariableDescriptions"]
+    )
+    df.attrs["VariableUnits"] = cellstr_to_list(tab_props["VariableUnits"])
+    df.attrs["VariableContinuity"] = cellstr_to_list(tab_props["VariableContinuity"])
+    df.attrs["DimensionNames"] = cellstr_to_list(tab_props["DimensionNames"])
     df.attrs["UserData"] = tab_props["UserData"]
 
     return df
@@ -41,15 +41,9 @@ def add_timetable_props(df, tab_props):
     """Add MATLAB table properties to pandas DataFrame
     These properties are mostly cell arrays of character vectors
     """
-    df.attrs["varDescriptions"] = [
-        s.item() if s.size > 0 else "" for s in tab_props["varDescriptions"].ravel()
-    ]
-    df.attrs["varUnits"] = [
-        s.item() if s.size > 0 else "" for s in tab_props["varUnits"].ravel()
-    ]
-    df.attrs["varContinuity"] = [
-        s.item() if s.size > 0 else "" for s in tab_props["varContinuity"].ravel()
-    ]
+    df.attrs["varDescriptions"] = cellstr_to_list(tab_props["varDescriptions"])
+    df.attrs["varUnits"] = cellstr_to_list(tab_props["varUnits"])
+    df.attrs["varContinuity"] = cellstr_to_list(tab_props["varContinuity"])
     df.attrs["UserData"] = tab_props["arrayProps"]["UserData"][0, 0]
     df.attrs["Description"] = (
         tab_props["arrayProps"]["Description"][0, 0].item()
@@ -63,8 +57,9 @@ def add_timetable_props(df, tab_props):
 def to_dataframe(data, nvars, varnames):
     """Creates a dataframe from coldata and column names"""
     rows = {}
+    vnames = cellstr_to_list(varnames)
     for i in range(nvars):
-        vname = varnames[0, i].item()
+        vname = vnames[i]
         coldata = data[0, i]
 
         # If variable is multicolumn data
@@ -102,7 +97,7 @@ def mat_to_table(props, add_table_attrs=False, **_kwargs):
     nrows = int(props[0, 0]["nrows"].item())
     rownames = props[0, 0]["rownames"]
     if rownames.size > 0:
-        rownames = [s.item() for s in rownames.ravel()]
+        rownames = cellstr_to_list(rownames)
         if len(rownames) == nrows:
             df.index = rownames
 
@@ -183,8 +178,7 @@ def mat_to_categorical(props, **_kwargs):
     4. isProtected - boolean indicating if the categorical is protected
     """
 
-    raw_names = props[0, 0]["categoryNames"]
-    category_names = [name.item() for name in raw_names.ravel()]
+    category_names = cellstr_to_list(props[0, 0]["categoryNames"])
 
     # MATLAB codes are 1-indexed as uint integers
     codes = props[0, 0]["codes"].astype(int) - 1
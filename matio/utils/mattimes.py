@@ -2,13 +2,25 @@
 
 import warnings
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import numpy as np
 
+# Duration display formats mapped to (milliseconds per unit, numpy unit code)
+DURATION_UNITS = {
+    "s": (1000, "s"),
+    "m": (1000 * 60, "m"),
+    "h": (1000 * 60 * 60, "h"),
+    "d": (1000 * 60 * 60 * 24, "D"),
+    "y": (1000 * 60 * 60 * 24 * 365, "Y"),
+}
 
+
+@lru_cache(maxsize=None)
 def get_tz_offset(tz):
     """Get timezone offset in milliseconds
+    Offsets are cached by timezone name, as files usually repeat the same timezone
     Inputs:
         1. tz (str): Timezone string
     Returns:
@@ -16,7 +28,10 @@ def get_tz_offset(tz):
     """
     try:
         tzinfo = ZoneInfo(tz)
-        utc_offset = tzinfo.utcoffset(datetime.now())
+        # Fixed-offset zones don't need a reference time
+        utc_offset = tzinfo.utcoffset(None)
+        if utc_offset is None:
+            utc_offset = tzinfo.utcoffset(datetime.now())
         if utc_offset is not None:
             offset = int(utc_offset.total_seconds() * 1000)
         else:
@@ -48,7 +63,15 @@ def mat_to_datetime(props, **_kwargs):
     else:
         offset = 0
 
-    millis = data.real + data.imag * 1e3 + offset
+    # Imaginary part only present when sub-millisecond precision is stored
+    # Accumulate in a single buffer to avoid full-size temporaries
+    if np.iscomplexobj(data):
+        millis = np.multiply(data.imag, 1e3)
+        np.add(millis, data.real, out=millis)
+    else:
+        millis = data.astype(np.float64)
+    if offset:
+        np.add(millis, offset, out=millis)
 
     return millis.astype("datetime64[ms]")
 
@@ -67,30 +90,15 @@ def mat_to_duration(props, **_kwargs):
         return np.array([], dtype="timedelta64[ms]")
 
     fmt = props[0, 0].get("fmt", None)
-    if fmt is None:
-        return millis.astype("timedelta64[ms]")
-
-    if fmt == "s":
-        count = millis / 1000  # Seconds
-        dur = count.astype("timedelta64[s]")
-    elif fmt == "m":
-        count = millis / (1000 * 60)  # Minutes
-        dur = count.astype("timedelta64[m]")
-    elif fmt == "h":
-        count = millis / (1000 * 60 * 60)  # Hours
-        dur = count.astype("timedelta64[h]")
-    elif fmt == "d":
-        count = millis / (1000 * 60 * 60 * 24)  # Days
-        dur = count.astype("timedelta64[D]")
-    elif fmt == "y":
-        count = millis / (1000 * 60 * 60 * 24 * 365)  # Years
-        dur = count.astype("timedelta64[Y]")
-    else:
-        count = millis
-        dur = count.astype("timedelta64[ms]")
+    unit = None
+    if fmt is not None and fmt.size == 1:
+        unit = DURATION_UNITS.get(fmt.item())
+    if unit is None:
         # Default case
+        return millis.astype("timedelta64[ms]")
 
-    return dur
+    scale, unit_code = unit
+    return (millis / scale).astype(f"timedelta64[{unit_code}]")
 
 
 def mat_to_calendarduration(props, **_kwargs):
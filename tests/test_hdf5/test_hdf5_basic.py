@@ -1,5 +1,6 @@
 import os
 
+import h5py
 import numpy as np
 import pytest
 from scipy.io import loadmat
@@ -23,3 +24,32 @@ def test_v73_load_basic(var_name, expected):
         np.testing.assert_array_equal(
             loaded_dict[var_name], expected
         )
+
+@pytest.mark.parametrize(
+    "file_path",
+    [basic_v7, basic_v73],
+    ids = ["v7", "v73"],
+)
+def test_load_basic_chunk_cache_kwargs(file_path):
+    # Chunk cache settings are accepted for every version, ignored below v7.3
+    loaded_dict = load_from_mat(
+        file_path, rdcc_nbytes=1024**2, rdcc_nslots=521, rdcc_w0=1.0
+    )
+    for var_name, expected in variables:
+        if isinstance(expected, np.ndarray):
+            np.testing.assert_array_equal(loaded_dict[var_name], expected)
+
+def test_v73_load_empty_logical(tmp_path):
+    # MATLAB stores empty arrays as their dimensions with a MATLAB_empty flag
+    file_path = tmp_path / "empty_logical_v73.mat"
+    with h5py.File(file_path, "w", userblock_size=512) as f:
+        dset = f.create_dataset("empty_logical", data=np.array([0, 3], dtype=np.uint64))
+        dset.attrs["MATLAB_class"] = np.bytes_(b"logical")
+        dset.attrs["MATLAB_empty"] = np.uint8(1)
+    with open(file_path, "r+b") as f:
+        header = b"MATLAB 7.3 MAT-file".ljust(116, b" ")
+        f.write(header + b"\x00" * 8 + b"\x00\x02" + b"IM")
+
+    loaded_dict = load_from_mat(file_path)
+    assert loaded_dict["empty_logical"].shape == (0, 3)
+    assert loaded_dict["empty_logical"].dtype == np.bool_
@@ -1,5 +1,6 @@
 import os
 
+import h5py
 import numpy as np
 import pytest
 from scipy.io import loadmat
@@ -65,3 +66,40 @@ def assert_mat_arrays_equal(actual, expected, name="var"):
 def test_v7_load_struct_cell(var_name, expected):
     loaded_dict = load_from_mat(sc_v73)
     assert_mat_arrays_equal(loaded_dict[var_name], expected)
+
+@pytest.mark.parametrize(
+    "var_name, expected",
+    variables,
+    ids = [v[0] for v in variables],
+)
+def test_v73_load_struct_cell_mmap(var_name, expected):
+    loaded_dict = load_from_mat(sc_v73, use_mmap=True)
+    assert_mat_arrays_equal(loaded_dict[var_name], expected)
+
+@pytest.mark.parametrize(
+    "var_name, expected",
+    variables,
+    ids = [v[0] for v in variables],
+)
+def test_v73_load_struct_cell_fileobj(var_name, expected):
+    with open(sc_v73, "rb") as f:
+        loaded_dict = load_from_mat(f)
+    assert_mat_arrays_equal(loaded_dict[var_name], expected)
+
+@pytest.mark.parametrize("use_mmap", [True, False], ids=["mmap", "no-mmap"])
+def test_v73_use_mmap_driver(monkeypatch, use_mmap):
+    h5py_file = h5py.File
+    calls = []
+
+    def recording_file(*args, **kwargs):
+        calls.append(kwargs)
+        return h5py_file(*args, **kwargs)
+
+    monkeypatch.setattr(h5py, "File", recording_file)
+    load_from_mat(sc_v73, use_mmap=use_mmap)
+
+    assert len(calls) == 1
+    if use_mmap:
+        assert calls[0].get("driver") == "core"
+    else:
+        assert "driver" not in calls[0]